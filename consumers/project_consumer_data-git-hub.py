@@ -11,6 +11,8 @@ Symbols:
   - BTC/USD  (crypto)
 
 Chart: Multi-line time series of % change since session start (per symbol).
+Backend: QtAgg when Qt bindings (PyQt6/PySide6/PyQt5/PySide2) are installed;
+set MPLBACKEND to use a different one.
 
 Run (Windows PowerShell):
   .\.venv\Scripts\activate
@@ -21,21 +23,59 @@ from __future__ import annotations
 
 import os
 import json
+import importlib.util
 import time
 import threading
 import traceback
 from collections import deque
-from typing import Dict, Deque, Tuple, List, Optional, Set
-from datetime import datetime, timezone
+from typing import Dict, Deque, Tuple, List, Optional, Set, Union
 
 # External deps
 from dotenv import load_dotenv
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 from websocket import WebSocketApp
 
-# Matplotlib
+# Hot path: inbound WS frames are decoded with orjson if available (else
+# stdlib json). orjson has no indent/sort_keys dump, so json stays for those.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Typed WS frame decoding if msgspec is available (else json_loads -> dict)
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# JIT-compiled % change kernel if numba is available (else plain NumPy)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Matplotlib: QtAgg redraws faster than the Tk default; MPLBACKEND overrides it.
+# Must be selected before pyplot is imported. Only forced once the Qt backend
+# actually imports, so a broken Qt install still falls back to Tk/Agg.
+import matplotlib
+if not os.getenv("MPLBACKEND") and any(
+    importlib.util.find_spec(qt) for qt in ("PyQt6", "PySide6", "PyQt5", "PySide2")
+):
+    try:
+        import matplotlib.backends.backend_qtagg  # noqa: F401
+        matplotlib.use("QtAgg")
+    except ImportError:
+        pass
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+from matplotlib.artist import Artist
+from matplotlib.lines import Line2D
+from matplotlib.text import Text
 
 # -----------------------
 # Configuration
@@ -47,22 +87,34 @@ SYMBOLS: List[str] = ["EUR/USD", "AAPL", "BTC/USD"]
 # Rolling window size per symbol
 MAX_TICKS_PER_SYMBOL = 300
 
-# Animation cadence and fallback poll frequency
-ANIMATE_INTERVAL_MS = 1000
+# Redraw check cadence (redraws only happen after new ticks, at most this often)
+# and fallback poll frequency
+REDRAW_INTERVAL_MS = 100
+AUTOSCALE_SECONDS = 1.0  # rescale at most this often, or sooner if data goes well past the y-limits
+AUTOSCALE_Y_OVERSHOOT = 0.10  # "well past": this fraction of the y-range
 FALLBACK_POLL_SECONDS = 15  # modest interval for REST fallback
+ERROR_REPORT_SECONDS = 1.0  # a repeated decode error prints at most this often
 
 # Twelve Data WS endpoint (API key appended at runtime)
 DEFAULT_TWELVE_WS_URL = "wss://ws.twelvedata.com/v1/quotes/price"
 
 # Twelve Data REST base (for /price fallback)
 TD_REST_BASE = "https://api.twelvedata.com"
+TD_PRICE_URL = f"{TD_REST_BASE}/price"
 
 # Fiat-only keyless fallback (used only for EUR/USD if no API key)
 EXHOST_BASE = "https://api.exchangerate.host"
+EXHOST_LATEST_URL = f"{EXHOST_BASE}/latest"
+EXHOST_EURUSD_PARAMS = {"base": "USD", "symbols": "EUR"}
 
 # Heartbeat cadence
 HEARTBEAT_SECONDS = 10
 
+# Raw WS frames buffered between the socket thread and the decoder thread
+RAW_QUEUE_MAX = 10000
+DECODE_BATCH_MAX = 256  # frames decoded per decoder pass
+BULK_APPEND_MIN = 12  # ticks per symbol from which RingBuf.extend beats append calls (measured)
+
 # -----------------------
 # Secrets
 # -----------------------
@@ -83,16 +135,165 @@ def load_api_key() -> Optional[str]:
 # In-memory store
 # -----------------------
 
-Store = Dict[str, Deque[Tuple[float, float]]]
-store: Store = {sym: deque(maxlen=MAX_TICKS_PER_SYMBOL) for sym in SYMBOLS}
+class RingBuf:
+    """
+    Fixed-size, time-ordered tick ring for one symbol, kept as parallel
+    float64 arrays (struct of arrays) instead of a deque of (ts, price) tuples.
+    """
+    __slots__ = ("ts", "px", "pct", "p0", "head", "n", "size", "lock")
+
+    def __init__(self, size: int):
+        self.ts = np.zeros(size, dtype=np.float64)  # epoch seconds
+        self.px = np.zeros(size, dtype=np.float64)
+        # Until the ring wraps its first price stays fixed, so % change is
+        # computed once per tick on append. After that the baseline moves
+        # with every tick and build_timeseries_pct recomputes the window.
+        self.pct = np.zeros(size, dtype=np.float64)
+        self.p0 = 0.0
+        self.head = 0  # next slot to write
+        self.n = 0  # slots holding data
+        self.size = size
+        # Writers (WS decoder, REST fallback) and the chart reader touch
+        # several fields per operation; the lock is held for one tick or
+        # one window copy, so it is effectively never contended.
+        self.lock = threading.Lock()
+
+    def append(self, ts: float, price: float) -> bool:
+        with self.lock:
+            i = self.head
+            n = self.n
+            # Keep the ring in time order so readers never have to sort it:
+            # a tick older than the newest stored one (e.g. a WS exchange
+            # timestamp behind a REST seed stamped with local time) is dropped.
+            if n and ts < self.ts[i - 1]:
+                return False
+            self.ts[i] = ts
+            self.px[i] = price
+            if n < self.size:
+                if n == 0:
+                    self.p0 = price
+                p0 = self.p0
+                self.pct[i] = (price / p0 - 1.0) * 100.0 if p0 else 0.0
+                self.n = n + 1
+            self.head = (i + 1) % self.size
+            return True
+
+    def extend(self, ts: np.ndarray, px: np.ndarray) -> int:
+        """Bulk append; same drop rule as append. Returns how many ticks were stored."""
+        with self.lock:
+            size = self.size
+            h = self.head
+            n = self.n
+            # A tick is kept if it is not older than every tick before it
+            # (stored or earlier in the batch) - append's rule, vectorized.
+            last = self.ts[h - 1] if n else -np.inf
+            keep = ts >= np.maximum.accumulate(np.concatenate(([last], ts[:-1])))
+            if not keep.all():
+                ts = ts[keep]
+                px = px[keep]
+            m = ts.shape[0]
+            if m == 0:
+                return 0
+            if n + m < size:
+                # Still filling: precompute % change as append does
+                p0 = px[0] if n == 0 else self.p0
+                self.p0 = p0
+                self.pct[n:n + m] = (px / p0 - 1.0) * 100.0 if p0 else 0.0
+            if m > size:
+                ts = ts[-size:]
+                px = px[-size:]
+            # At most two slice copies: up to the end of the ring, then from 0
+            k = ts.shape[0]
+            first = min(k, size - h)
+            self.ts[h:h + first] = ts[:first]
+            self.px[h:h + first] = px[:first]
+            self.ts[:k - first] = ts[first:]
+            self.px[:k - first] = px[first:]
+            self.head = (h + k) % size
+            self.n = min(n + m, size)
+            return m
+
+    def window(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Snapshot (epoch seconds, % change vs. oldest), oldest first, as owned copies."""
+        with self.lock:
+            n = self.n
+            h = self.head
+            if n < self.size:
+                # Not wrapped yet: % change was filled in by append
+                return self.ts[:n].copy(), self.pct[:n].copy()
+            if NUMBA_AVAILABLE:
+                t = np.empty(n)
+                pct = np.empty(n)
+                compute_pct_window(self.ts, self.px, h, n, t, pct)
+                return t, pct
+            t = unroll(self.ts, h, n)
+            p = unroll(self.px, h, n)
+        p0 = p[0]
+        if p0 == 0:
+            return t, np.zeros(n)
+        return t, (p / p0 - 1.0) * 100.0
+
+# SYMBOLS is fixed, so rings are indexed by position; the tick path does one
+# dict probe (SYMBOL_INDEX) and then a list index.
+SYMBOL_INDEX: Dict[str, int] = {sym: i for i, sym in enumerate(SYMBOLS)}
+rings: List[RingBuf] = [RingBuf(MAX_TICKS_PER_SYMBOL) for _ in SYMBOLS]
+
+# Bumped on every stored tick; the chart skips frames where it is unchanged.
+# Written by the decoder and fallback threads, so bumps (load/add/store) take
+# tick_epoch_lock; the chart only reads it.
+tick_epoch = 0
+tick_epoch_lock = threading.Lock()
+
+def bump_tick_epoch(stored: int):
+    global tick_epoch
+    if stored:
+        with tick_epoch_lock:
+            tick_epoch += stored
+
+def append_tick(idx: int, ts: float, price: float) -> bool:
+    """Store one tick for SYMBOLS[idx]; returns False if it was dropped."""
+    if rings[idx].append(ts, price):
+        bump_tick_epoch(1)
+        return True
+    return False
+
+def append_ticks(idx: int, ts: List[float], px: List[float]) -> int:
+    """Store a time-ordered batch for SYMBOLS[idx]; returns how many were kept."""
+    ring = rings[idx]
+    if len(ts) < BULK_APPEND_MIN:
+        # Typical case (a few ticks per symbol per pass): below BULK_APPEND_MIN
+        # extend's array setup costs more than it saves
+        append = ring.append
+        stored = 0
+        for t, p in zip(ts, px):
+            stored += append(t, p)
+    else:
+        stored = ring.extend(np.asarray(ts, dtype=np.float64), np.asarray(px, dtype=np.float64))
+    bump_tick_epoch(stored)
+    return stored
+
+def unroll(buf: np.ndarray, h: int, n: int) -> np.ndarray:
+    """Oldest-to-newest copy of a ring array: one slice copy unless it has wrapped."""
+    if n < buf.shape[0] or h == 0:
+        return buf[:n].copy()
+    return np.concatenate((buf[h:], buf[:h]))
 
 # Track which symbols have live WS ticks (accepted) or were rejected
 WS_ACTIVE: Set[str] = set()
 WS_FAILED: Set[str] = set()
+ws_failed_version = 0  # bumped whenever WS_FAILED changes
+
+# Raw WS frames; the socket thread only appends, the decoder thread pops.
+# deque append/popleft are atomic in CPython, so no lock is needed.
+raw_q: Deque[bytes] = deque(maxlen=RAW_QUEUE_MAX)
+raw_dropped = 0  # frames evicted because the decoder fell behind
+raw_ready = threading.Event()  # set by the socket thread after each append
 
 # Control
 stop_event = threading.Event()
 ws_thread: Optional[threading.Thread] = None
+decoder_thread: Optional[threading.Thread] = None
+fallback_thread: Optional[threading.Thread] = None
 
 # -----------------------
 # WS helpers
@@ -108,83 +309,232 @@ def build_subscribe_payload(symbols: List[str]) -> str:
 def build_heartbeat_payload() -> str:
     return json.dumps({"action": "heartbeat"})
 
-def parse_price_message(obj: dict) -> Optional[Tuple[str, float, float]]:
-    # Accept 'price' / 'trade' / 'quote' generically
-    ev = obj.get("event")
-    if ev not in (None, "price", "trade", "quote"):
+# Constant for the life of the process; serialized once
+HEARTBEAT_PAYLOAD = build_heartbeat_payload()
+
+# Events that carry a price tick (Twelve Data omits "event" on some frames)
+_PRICE_EVENTS = frozenset({None, "price", "trade", "quote"})
+_FALLBACK_PRICE_KEYS = ("last", "close", "bid")
+
+def parse_price_message(obj: dict, _now=time.time) -> Optional[Tuple[str, float, float]]:
+    if obj.get("event") not in _PRICE_EVENTS:
         return None
     sym = obj.get("symbol")
     if not sym:
         return None
-    price = None
-    for k in ("price", "last", "close", "bid"):
-        if k in obj:
-            try:
-                price = float(obj[k])
+    # Twelve Data price events always carry "price"; other keys are a rare fallback
+    px = obj.get("price")
+    if px is None:
+        for k in _FALLBACK_PRICE_KEYS:
+            px = obj.get(k)
+            if px is not None:
                 break
-            except Exception:
-                pass
-    if price is None:
-        return None
+        else:
+            return None
+    if type(px) is float:
+        price = px
+    else:
+        # ints, or numeric strings such as "1.0895"
+        try:
+            price = float(px)
+        except (TypeError, ValueError):
+            return None
     ts = obj.get("timestamp")
     if isinstance(ts, (int, float)):
+        # Twelve Data sends epoch seconds as a JSON number
+        return (sym, price, float(ts))
+    if ts is None:
+        return (sym, price, _now())
+    try:
         ts_s = float(ts)
-    elif isinstance(ts, str):
-        try:
-            ts_s = float(ts)
-        except Exception:
-            ts_s = time.time()
-    else:
-        ts_s = time.time()
+    except (TypeError, ValueError):
+        ts_s = _now()
     return (sym, price, ts_s)
 
 def _as_list(maybe_list_or_none):
-    """Normalize a subscribe-status field that could be list | dict | None into a list."""
+    """Normalize a subscribe-status field that could be list | dict | None into a sequence."""
     if maybe_list_or_none is None:
-        return []
+        return ()
     if isinstance(maybe_list_or_none, list):
         return maybe_list_or_none
     return [maybe_list_or_none]
 
-def on_message(app: WebSocketApp, message: str):
+def on_message(app: WebSocketApp, message: bytes):
+    # Runs on the socket thread: enqueue only, decoding happens in decoder_worker
+    global raw_dropped
+    if len(raw_q) == RAW_QUEUE_MAX:
+        raw_dropped += 1
+    raw_q.append(message)
+    raw_ready.set()
+
+def handle_subscribe_status(obj: dict):
+    print("[WS] subscribe-status raw:")
     try:
-        data = json.loads(message)
-        batch = data if isinstance(data, list) else [data]
-        for obj in batch:
-            if obj.get("event") == "subscribe-status":
-                print("[WS] subscribe-status raw:")
-                try:
-                    print(json.dumps(obj, indent=2, sort_keys=True))
-                except Exception:
-                    print(obj)
-
-                succ_items = _as_list(obj.get("success"))
-                fail_items = _as_list(obj.get("fails"))
-
-                succ = {d.get("symbol") for d in succ_items if isinstance(d, dict) and d.get("symbol")}
-                fail = {d.get("symbol") for d in fail_items if isinstance(d, dict) and d.get("symbol")}
-
-                WS_ACTIVE.update(succ)
-                WS_FAILED.update(fail)
-
-                st = obj.get("status", "unknown")
-                msg = obj.get("message") or obj.get("info") or obj.get("detail") or ""
-                print(f"[WS] subscribe-status: {st} {msg}")
-                if succ:
-                    print(f"[WS] live ticks: {sorted(succ)}")
-                if fail:
-                    print(f"[WS] WS-rejected (REST fallback): {sorted(fail)}")
-                continue
-
-            parsed = parse_price_message(obj)
-            if parsed is None:
-                continue
-            sym, price, ts_s = parsed
-            if sym in store:
-                store[sym].append((ts_s, price))
-                WS_ACTIVE.add(sym)  # defensive
+        print(json.dumps(obj, indent=2, sort_keys=True))
     except Exception:
-        traceback.print_exc()
+        print(obj)
+
+    succ_items = _as_list(obj.get("success"))
+    fail_items = _as_list(obj.get("fails"))
+
+    succ = {s for d in succ_items if isinstance(d, dict) and (s := d.get("symbol"))}
+    fail = {s for d in fail_items if isinstance(d, dict) and (s := d.get("symbol"))}
+
+    global ws_failed_version
+    WS_ACTIVE.update(succ)
+    if not fail <= WS_FAILED:
+        WS_FAILED.update(fail)
+        ws_failed_version += 1
+
+    st = obj.get("status", "unknown")
+    msg = obj.get("message") or obj.get("info") or obj.get("detail") or ""
+    print(f"[WS] subscribe-status: {st} {msg}")
+    if succ:
+        print(f"[WS] live ticks: {sorted(succ)}")
+    if fail:
+        print(f"[WS] WS-rejected (REST fallback): {sorted(fail)}")
+
+def flush_pending(pending: Dict[int, Tuple[List[float], List[float]]]):
+    """Store ticks grouped by symbol index: one append_ticks call per symbol per batch."""
+    for idx, (ts, px) in pending.items():
+        try:
+            append_ticks(idx, ts, px)
+            WS_ACTIVE.add(SYMBOLS[idx])  # defensive (in case status was missed)
+        except Exception as e:
+            print_exc_throttled(e)
+    pending.clear()
+
+# Decoder-thread error throttle: a malformed burst prints one traceback per
+# exception type per ERROR_REPORT_SECONDS instead of one per frame. Keyed on
+# the type alone, since JSON error messages embed the offset and differ per
+# frame. Only the decoder thread uses it.
+_error_last_shown: Dict[type, float] = {}
+_errors_suppressed: Dict[type, int] = {}
+
+def print_exc_throttled(e: Exception):
+    kind = type(e)
+    now = time.monotonic()
+    last = _error_last_shown.get(kind)
+    if last is not None and now - last < ERROR_REPORT_SECONDS:
+        _errors_suppressed[kind] = _errors_suppressed.get(kind, 0) + 1
+        return
+    hidden = _errors_suppressed.pop(kind, 0)
+    if hidden:
+        print(f"[WS] ({hidden} more {kind.__name__} decode error(s) not shown)")
+    _error_last_shown[kind] = now
+    traceback.print_exception(e)
+
+def handle_messages(messages: List[bytes]):
+    # Bind globals to locals once per batch; the loop body runs per frame
+    loads = json_loads
+    parse = parse_price_message
+    index_of = SYMBOL_INDEX.get
+    pending: Dict[int, Tuple[List[float], List[float]]] = {}
+    for message in messages:
+        try:
+            data = loads(message)
+            for obj in (data if isinstance(data, list) else (data,)):
+                if obj.get("event") == "subscribe-status":
+                    handle_subscribe_status(obj)
+                    continue
+                parsed = parse(obj)
+                if parsed is None:
+                    continue
+                sym, price, ts_s = parsed
+                idx = index_of(sym)
+                if idx is None:
+                    continue
+                slot = pending.get(idx)
+                if slot is None:
+                    slot = pending[idx] = ([], [])
+                slot[0].append(ts_s)
+                slot[1].append(price)
+        except Exception as e:
+            print_exc_throttled(e)
+    flush_pending(pending)
+
+if MSGSPEC_AVAILABLE:
+    class PriceMsg(msgspec.Struct):
+        """Fields of a Twelve Data WS frame used for ticks; other keys are ignored."""
+        event: Optional[str] = None
+        symbol: str = ""
+        price: Optional[float] = None
+        last: Optional[float] = None
+        close: Optional[float] = None
+        bid: Optional[float] = None
+        timestamp: Optional[float] = None
+
+    # strict=False accepts string-encoded numbers ("1.0895")
+    _decode_frame = msgspec.json.Decoder(Union[PriceMsg, List[PriceMsg]], strict=False).decode
+
+def handle_messages_typed(messages: List[bytes]):
+    """Like handle_messages, but decodes frames straight into PriceMsg structs."""
+    decode = _decode_frame
+    index_of = SYMBOL_INDEX.get
+    now = time.time
+    pending: Dict[int, Tuple[List[float], List[float]]] = {}
+    for message in messages:
+        try:
+            data = decode(message)
+        except msgspec.ValidationError:
+            data = None  # valid JSON that does not fit PriceMsg
+        except Exception as e:
+            print_exc_throttled(e)
+            continue
+        if data is None:
+            # Use the generic path outside the except block (no chained
+            # traceback), after storing earlier ticks so each ring stays in
+            # time order
+            flush_pending(pending)
+            handle_messages([message])
+            continue
+        try:
+            items = data if isinstance(data, list) else (data,)
+            for k, m in enumerate(items):
+                if m.event not in _PRICE_EVENTS:
+                    if m.event == "subscribe-status":
+                        raw = json_loads(message)
+                        handle_subscribe_status(raw[k] if isinstance(raw, list) else raw)
+                    continue
+                idx = index_of(m.symbol)
+                if idx is None:
+                    continue
+                # Same precedence as parse_price_message: "price" unless missing
+                price = m.price
+                if price is None:
+                    price = next((v for v in (m.last, m.close, m.bid) if v is not None), None)
+                    if price is None:
+                        continue
+                ts = m.timestamp
+                slot = pending.get(idx)
+                if slot is None:
+                    slot = pending[idx] = ([], [])
+                slot[0].append(now() if ts is None else ts)
+                slot[1].append(price)
+        except Exception as e:
+            print_exc_throttled(e)
+    flush_pending(pending)
+
+def decoder_worker():
+    handle = handle_messages_typed if MSGSPEC_AVAILABLE else handle_messages
+    popleft = raw_q.popleft
+    batch: List[bytes] = []
+    while not stop_event.is_set():
+        # Sleep until the socket thread enqueues something instead of polling;
+        # clear before draining so a frame that lands mid-drain re-arms it.
+        # The timeout only bounds how long shutdown can take.
+        if not raw_ready.wait(0.5):
+            continue
+        raw_ready.clear()
+        while raw_q:
+            while raw_q and len(batch) < DECODE_BATCH_MAX:
+                batch.append(popleft())
+            try:
+                handle(batch)
+            except Exception as e:
+                # Handlers catch per frame; this only keeps the thread alive
+                print_exc_throttled(e)
+            batch.clear()
 
 def on_error(app: WebSocketApp, error):
     print(f"[WS] Error: {error}")
@@ -195,17 +545,16 @@ def on_close(app: WebSocketApp, status_code, msg):
 def heartbeat_worker(app: WebSocketApp):
     while not stop_event.is_set() and getattr(app, "keep_running", False):
         try:
-            app.send(build_heartbeat_payload())
+            app.send(HEARTBEAT_PAYLOAD)
         except Exception:
             pass
-        for _ in range(HEARTBEAT_SECONDS):
-            if stop_event.is_set() or not getattr(app, "keep_running", False):
-                break
-            time.sleep(1)
+        # One timed wait per heartbeat; returns True at once on shutdown
+        if stop_event.wait(HEARTBEAT_SECONDS):
+            break
 
-def on_open(app: WebSocketApp, symbols: List[str]):
+def on_open(app: WebSocketApp, symbols: List[str], subscribe_payload: str):
     try:
-        app.send(build_subscribe_payload(symbols))
+        app.send(subscribe_payload)
         print(f"[WS] Subscribed to: {', '.join(symbols)}")
         t = threading.Thread(target=heartbeat_worker, args=(app,), daemon=True)
         t.start()
@@ -213,6 +562,7 @@ def on_open(app: WebSocketApp, symbols: List[str]):
         traceback.print_exc()
 
 def ws_worker(ws_url: str, symbols: List[str]):
+    subscribe_payload = build_subscribe_payload(symbols)  # reused on every reconnect
     while not stop_event.is_set():
         try:
             app = WebSocketApp(
@@ -221,8 +571,10 @@ def ws_worker(ws_url: str, symbols: List[str]):
                 on_error=on_error,
                 on_close=on_close,
             )
-            app.on_open = lambda a: on_open(a, symbols)
-            app.run_forever(ping_interval=20, ping_timeout=10)
+            app.on_open = lambda a: on_open(a, symbols, subscribe_payload)
+            # Frames are JSON that the decoder parses (and so validates) anyway;
+            # skipping the UTF-8 check also hands on_message the raw bytes.
+            app.run_forever(ping_interval=20, ping_timeout=10, skip_utf8_validation=True)
         except Exception as e:
             print(f"[WS] Worker exception: {e}")
         if not stop_event.is_set():
@@ -232,6 +584,40 @@ def ws_worker(ws_url: str, symbols: List[str]):
 # Fallback polling
 # -----------------------
 
+# One keep-alive session for both REST fallbacks so repeat polls reuse the
+# TCP/TLS connection instead of handshaking every FALLBACK_POLL_SECONDS.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers["Connection"] = "keep-alive"
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=1, max_retries=2))
+
+# Validators and body of the last 200 per request, for conditional GETs.
+# Only fallback_worker polls, so no lock is needed.
+_http_cache: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Tuple[Dict[str, str], object]] = {}
+
+def get_json(url: str, params: Dict[str, str]):
+    """
+    GET a JSON body through HTTP_SESSION. If the server sent an ETag or
+    Last-Modified last time, ask with If-None-Match / If-Modified-Since and
+    reuse the cached body on 304 Not Modified.
+    """
+    key = (url, tuple(sorted(params.items())))
+    cached = _http_cache.get(key)
+    resp = HTTP_SESSION.get(url, params=params, headers=cached[0] if cached else None, timeout=8)
+    if resp.status_code == 304 and cached:
+        return cached[1]
+    resp.raise_for_status()
+    payload = resp.json()
+    validators = {}
+    if "ETag" in resp.headers:
+        validators["If-None-Match"] = resp.headers["ETag"]
+    if "Last-Modified" in resp.headers:
+        validators["If-Modified-Since"] = resp.headers["Last-Modified"]
+    if validators:
+        _http_cache[key] = (validators, payload)
+    else:
+        _http_cache.pop(key, None)
+    return payload
+
 def poll_twelvedata_price_once(symbols: List[str], api_key: Optional[str]) -> int:
     """
     Lightweight fallback using Twelve Data REST /price.
@@ -241,11 +627,8 @@ def poll_twelvedata_price_once(symbols: List[str], api_key: Optional[str]) -> in
         return 0
     try:
         # Batch request: /price?symbol=AAPL,EUR/USD,BTC/USD&apikey=...
-        url = f"{TD_REST_BASE}/price"
         params = {"symbol": ",".join(symbols), "apikey": api_key}
-        resp = requests.get(url, params=params, timeout=8)
-        resp.raise_for_status()
-        payload = resp.json()
+        payload = get_json(TD_PRICE_URL, params)
 
         # Response can be a dict of dicts (one per symbol) or a single dict if one symbol
         now = time.time()
@@ -255,8 +638,8 @@ def poll_twelvedata_price_once(symbols: List[str], api_key: Optional[str]) -> in
             # Single
             sym = payload.get("symbol")
             price = float(payload.get("price"))
-            if sym in store:
-                store[sym].append((now, price))
+            idx = SYMBOL_INDEX.get(sym)
+            if idx is not None and append_tick(idx, now, price):
                 added += 1
         else:
             # Multi-symbol response: keys are symbols
@@ -265,8 +648,8 @@ def poll_twelvedata_price_once(symbols: List[str], api_key: Optional[str]) -> in
                     price = float(obj.get("price"))
                 except Exception:
                     continue
-                if sym in store:
-                    store[sym].append((now, price))
+                idx = SYMBOL_INDEX.get(sym)
+                if idx is not None and append_tick(idx, now, price):
                     added += 1
 
         if added:
@@ -277,24 +660,42 @@ def poll_twelvedata_price_once(symbols: List[str], api_key: Optional[str]) -> in
         traceback.print_exc()
         return 0
 
+def fallback_worker(api_key: Optional[str]):
+    """
+    REST fallback on its own thread, so a slow HTTP call never stalls the chart.
+    Every FALLBACK_POLL_SECONDS: poll WS-rejected symbols, or all of them on a
+    cold start (no data yet) to show lines ASAP.
+    """
+    rejected: List[str] = []
+    seen_version = -1
+    while True:
+        # Rebuild the rejected list only when a subscribe-status changed it
+        if seen_version != ws_failed_version:
+            seen_version = ws_failed_version
+            rejected = [s for s in SYMBOLS if s in WS_FAILED]
+        if rejected:
+            added = poll_twelvedata_price_once(rejected, api_key)
+            # If no API key, at least try EUR/USD via exchangerate.host
+            if added == 0 and api_key is None and "EUR/USD" in rejected:
+                poll_exchangerate_host_eurusd_once()
+        elif not any(ring.n for ring in rings):
+            poll_twelvedata_price_once(SYMBOLS, api_key)
+            if api_key is None:
+                poll_exchangerate_host_eurusd_once()
+        if stop_event.wait(FALLBACK_POLL_SECONDS):
+            break
+
 def poll_exchangerate_host_eurusd_once() -> int:
     """
     Keyless fallback for EUR/USD only (if no Twelve Data API key).
     """
     try:
-        resp = requests.get(
-            f"{EXHOST_BASE}/latest",
-            params={"base": "USD", "symbols": "EUR"},
-            timeout=8,
-        )
-        resp.raise_for_status()
-        j = resp.json()
+        j = get_json(EXHOST_LATEST_URL, EXHOST_EURUSD_PARAMS)
         rate = float(j.get("rates", {}).get("EUR"))
         now = time.time()
         # USD->EUR = rate, so EUR/USD = 1 / rate
         price = 1.0 / rate if rate else None
-        if price:
-            store["EUR/USD"].append((now, price))
+        if price and append_tick(SYMBOL_INDEX["EUR/USD"], now, price):
             print("[Fallback] Added 1 point for: EUR/USD (exchangerate.host)")
             return 1
     except Exception:
@@ -305,21 +706,38 @@ def poll_exchangerate_host_eurusd_once() -> int:
 # Timeseries builder (% change)
 # -----------------------
 
-def build_timeseries_pct(store: Store) -> Dict[str, Tuple[List[datetime], List[float]]]:
-    out: Dict[str, Tuple[List[datetime], List[float]]] = {}
-    for sym, dq in store.items():
-        if not dq:
-            out[sym] = ([], [])
-            continue
-        rows = sorted(dq, key=lambda t: t[0])
-        ts_list = [datetime.fromtimestamp(ts, tz=timezone.utc) for ts, _ in rows]
-        px_list = [px for _, px in rows]
-        p0 = px_list[0]
-        if p0 == 0:
-            pct = [0.0 for _ in px_list]
-        else:
-            pct = [((p / p0) - 1.0) * 100.0 for p in px_list]
-        out[sym] = (ts_list, pct)
+# Matplotlib date number of the Unix epoch; x = seconds / 86400 + this
+_MPL_UNIX_EPOCH = mdates.date2num(np.datetime64("1970-01-01T00:00:00"))
+
+def compute_pct_window(ts_ring, px_ring, h, n, out_ts, out_pct):
+    """Unroll the newest n ring entries into out_ts/out_pct (% vs. oldest) in one pass."""
+    maxlen = ts_ring.shape[0]
+    start = (h - n) % maxlen
+    p0 = px_ring[start]
+    for k in range(n):
+        j = (start + k) % maxlen
+        out_ts[k] = ts_ring[j]
+        # Same expression as the NumPy path, so both give identical results
+        out_pct[k] = (px_ring[j] / p0 - 1.0) * 100.0 if p0 != 0.0 else 0.0
+
+if NUMBA_AVAILABLE:
+    compute_pct_window = njit(cache=True)(compute_pct_window)
+
+def warm_up_kernels():
+    """Compile JIT kernels now so the first chart update doesn't pay for it."""
+    if NUMBA_AVAILABLE:
+        z = np.zeros(1)
+        compute_pct_window(z, z, 0, 1, np.empty(1), np.empty(1))
+
+def build_timeseries_pct() -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Per symbol: (matplotlib date numbers, % change vs. first point in window).
+    Ticks are appended in time order, so each ring is only unrolled, never sorted.
+    """
+    out: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    for sym, ring in zip(SYMBOLS, rings):
+        t, pct = ring.window()
+        out[sym] = (t / 86400.0 + _MPL_UNIX_EPOCH, pct)
     return out
 
 # -----------------------
@@ -328,57 +746,117 @@ def build_timeseries_pct(store: Store) -> Dict[str, Tuple[List[datetime], List[f
 
 fig, ax = plt.subplots(figsize=(9, 5))
 
-def init_chart():
-    ax.clear()
-    ax.set_title("Live Prices: % Change Since Session Start (UTC)")
-    ax.set_xlabel("Time")
-    ax.set_ylabel("% change")
-    ax.grid(True, axis="both")
-    return []
-
-def update_chart(_frame_idx):
-    # If some symbols were rejected by WS, poll TD REST for those
-    rejected = sorted(s for s in SYMBOLS if (s in WS_FAILED))
-    api_key = os.getenv("TWELVE_DATA_API_KEY")  # already loaded by load_dotenv()
-    if rejected:
-        if (update_chart._last_poll is None) or (time.time() - update_chart._last_poll >= FALLBACK_POLL_SECONDS):
-            added = poll_twelvedata_price_once(rejected, api_key)
-            # If no API key, at least try EUR/USD via exchangerate.host
-            if added == 0 and api_key is None and "EUR/USD" in rejected:
-                poll_exchangerate_host_eurusd_once()
-            update_chart._last_poll = time.time()
-
-    # If NONE have data yet (cold start), seed via REST for all three (cheap) to show lines ASAP
-    if all(len(dq) == 0 for dq in store.values()):
-        if (update_chart._last_poll is None) or (time.time() - update_chart._last_poll >= FALLBACK_POLL_SECONDS):
-            poll_twelvedata_price_once(SYMBOLS, api_key)
-            if api_key is None:
-                poll_exchangerate_host_eurusd_once()
-            update_chart._last_poll = time.time()
+# Persistent artists: one Line2D per symbol plus the "waiting" banner.
+# They are created once and only their data/visibility changes per frame,
+# so they can be blitted over a cached background instead of redrawing the
+# whole figure.
+lines: Dict[str, Line2D] = {}
+waiting_text: Optional[Text] = None
+blit_background = None  # figure pixels without the animated artists
 
-    series = build_timeseries_pct(store)
+def chart_artists() -> List[Artist]:
+    return [*lines.values(), waiting_text]
 
-    ax.clear()
+def init_chart():
+    global waiting_text
     ax.set_title("Live Prices: % Change Since Session Start (UTC)")
     ax.set_xlabel("Time")
     ax.set_ylabel("% change")
     ax.grid(True, axis="both")
+    ax.xaxis_date(tz="UTC")
+    ax.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M:%S", tz="UTC"))
+    if not lines:
+        for sym in SYMBOLS:
+            lines[sym] = ax.plot([], [], label=sym)[0]
+        ax.legend(loc="upper left")
+        waiting_text = ax.text(0.5, 0.5, "Waiting for data...", ha="center", va="center", transform=ax.transAxes)
+        for artist in chart_artists():
+            artist.set_animated(True)  # left out of full draws; blitted instead
+    return chart_artists()
+
+def on_draw(_event):
+    """After every full draw (first show, resize, rescale): re-cache the background."""
+    global blit_background
+    canvas = fig.canvas
+    if getattr(canvas, "supports_blit", False):
+        blit_background = canvas.copy_from_bbox(fig.bbox)
+    for artist in chart_artists():
+        fig.draw_artist(artist)
+
+def blit_chart():
+    canvas = fig.canvas
+    if blit_background is None:
+        canvas.draw_idle()  # no cached background (yet, or backend can't blit)
+        return
+    canvas.restore_region(blit_background)
+    for artist in chart_artists():
+        fig.draw_artist(artist)
+    canvas.blit(fig.bbox)
+
+def data_beyond_ylim(series: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> bool:
+    """
+    True if any series is more than AUTOSCALE_Y_OVERSHOOT of the y-range outside
+    the y-limits. x is left to the periodic autoscale: on a moving time axis
+    new ticks pass the right edge almost every frame.
+    """
+    y0, y1 = ax.get_ylim()
+    pad = (y1 - y0) * AUTOSCALE_Y_OVERSHOOT
+    lo, hi = y0 - pad, y1 + pad
+    for _times, pct in series.values():
+        if len(pct) and (pct.min() < lo or pct.max() > hi):
+            return True
+    return False
+
+def rescale_axes() -> bool:
+    """relim + autoscale; if the limits moved, do the full draw that re-caches the blit background."""
+    limits = (ax.get_xlim(), ax.get_ylim())
+    ax.relim()
+    ax.autoscale_view(scalex=True, scaley=True)
+    if (ax.get_xlim(), ax.get_ylim()) == limits:
+        return False
+    # Ticks and grid live in the blit background; a full draw re-renders it
+    # and on_draw caches it for the new view.
+    fig.canvas.draw()
+    return True
+
+def update_chart():
+    # Runs on a canvas timer. Time-based autoscale, not per frame: a rescale
+    # usually ends in a full draw, and busy feeds produce a frame every
+    # REDRAW_INTERVAL_MS.
+    now = time.monotonic()
+    if tick_epoch == update_chart._last_epoch:
+        # No new ticks; only catch up on a rescale the last ones still need
+        # (e.g. they landed right of the x-limit just after a rescale)
+        if update_chart._autoscale_pending and now >= update_chart._next_autoscale:
+            update_chart._autoscale_pending = False
+            update_chart._next_autoscale = now + AUTOSCALE_SECONDS
+            rescale_axes()
+        return
+    update_chart._last_epoch = tick_epoch
+
+    series = build_timeseries_pct()
 
     any_data = False
     for sym in SYMBOLS:
-        times, pct = series.get(sym, ([], []))
-        if times and pct:
+        times, pct = series[sym]
+        if len(pct):
             any_data = True
-            ax.plot(times, pct, label=sym)
-
-    if not any_data:
-        ax.text(0.5, 0.5, "Waiting for data...", ha="center", va="center", transform=ax.transAxes)
-        return []
+        lines[sym].set_data(times, pct)
+    waiting_text.set_visible(not any_data)
+
+    if any_data and (now >= update_chart._next_autoscale or data_beyond_ylim(series)):
+        update_chart._autoscale_pending = False
+        update_chart._next_autoscale = now + AUTOSCALE_SECONDS
+        if rescale_axes():
+            return
+    else:
+        update_chart._autoscale_pending = any_data
 
-    ax.legend(loc="best")
-    return []
+    blit_chart()
 
-update_chart._last_poll = None  # type: ignore[attr-defined]
+update_chart._last_epoch = -1  # type: ignore[attr-defined]
+update_chart._next_autoscale = 0.0  # type: ignore[attr-defined]
+update_chart._autoscale_pending = False  # type: ignore[attr-defined]
 
 # -----------------------
 # Main
@@ -389,28 +867,39 @@ def main():
     if not api_key:
         print("[WS] No TWELVE_DATA_API_KEY found (.env or secrets/). WS may reject; REST fallback limited to EUR/USD for fiat only.")
     ws_url = build_ws_url(api_key)
+    warm_up_kernels()
 
-    global ws_thread
+    global ws_thread, decoder_thread, fallback_thread
     if api_key:
         print(f"[WS] Connecting: {ws_url}")
+        decoder_thread = threading.Thread(target=decoder_worker, daemon=True)
+        decoder_thread.start()
         ws_thread = threading.Thread(target=ws_worker, args=(ws_url, SYMBOLS), daemon=True)
         ws_thread.start()
 
-    ani = FuncAnimation(
-        fig,
-        update_chart,
-        init_func=init_chart,
-        interval=ANIMATE_INTERVAL_MS,
-        blit=False,
-        cache_frame_data=False,  # silence cache warning
-    )
+    fallback_thread = threading.Thread(target=fallback_worker, args=(api_key,), daemon=True)
+    fallback_thread.start()
+
+    init_chart()
+    fig.canvas.mpl_connect("draw_event", on_draw)
+    # Event-driven redraws: the timer only compares tick_epoch until ticks arrive
+    timer = fig.canvas.new_timer(interval=REDRAW_INTERVAL_MS)
+    timer.add_callback(update_chart)
+    timer.start()
     plt.tight_layout()
     plt.show()
 
     # Cleanup
     stop_event.set()
+    raw_ready.set()  # wake the decoder so it sees stop_event
     if ws_thread and ws_thread.is_alive():
         ws_thread.join(timeout=3)
+    if decoder_thread and decoder_thread.is_alive():
+        decoder_thread.join(timeout=3)
+    if fallback_thread and fallback_thread.is_alive():
+        fallback_thread.join(timeout=3)
+    if raw_dropped:
+        print(f"[WS] Dropped {raw_dropped} frame(s) while the decoder was behind")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file